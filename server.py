@@ -1,43 +1,166 @@
 #!/usr/bin/env python3
 
+import asyncio
+from cachetools import TLRUCache
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
+import functools
 import httpx
-import json
+import logging
+from operator import itemgetter
+import orjson
 import os
-from typing import Optional, Dict, Any, List
-from urllib.parse import urlencode
+from typing import Optional, Dict, Any, List, Union
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # BGS FROST Server API base URL
 BGS_API_BASE = 'https://sensors.bgs.ac.uk/FROST-Server/v1.1'
 
+logger = logging.getLogger(__name__)
+
+# Errors treated as "upstream data unavailable" rather than propagated
+API_ERRORS = (httpx.HTTPError, orjson.JSONDecodeError, KeyError)
+
+# Tool parameter name, OData system query option and value converter (None passes the value through)
+ODATA_PARAMS = (
+    ('limit', '$top', str),
+    ('filter', '$filter', None),
+    ('expand', '$expand', None),
+    ('orderby', '$orderby', None),
+    ('select', '$select', None),
+    ('skip', '$skip', str),
+    ('count', '$count', lambda value: 'true')
+)
+
+# Per-request headers; User-Agent is set once on the shared client, and httpx already
+# advertises every Accept-Encoding it can decode (br when brotli is installed)
+HEADERS_JSON = {'Accept': 'application/json'}
+HEADERS_CSV = {'Accept': 'text/csv'}
+
+# $select/$expand projections limited to the fields each tool reads
+SEARCH_SELECT = 'id,name,description'
+SEARCH_EXPAND = 'Locations($select=name,location),Datastreams($select=id)'
+DATASTREAM_SELECT = 'id,name,description,unitOfMeasurement'
+DATASTREAM_EXPAND = 'Thing($select=id,name),ObservedProperty($select=id,name,definition,description),Sensor($select=id,name,description)'
+OBSERVATION_SELECT = 'id,result,phenomenonTime,resultTime,resultQuality'
+OBSERVATION_EXPAND = 'Datastream($select=id,name,unitOfMeasurement;$expand=ObservedProperty($select=name),Thing($select=name))'
+LOCATION_SELECT = 'id,name,description,encodingType,location'
+LOCATION_EXPAND = 'Things($select=id,name,description;$expand=Datastreams($select=id))'
+DETAIL_LOCATION_SELECT = 'name,description,location'
+DETAIL_DATASTREAM_SELECT = 'name,description,unitOfMeasurement'
+DETAIL_DATASTREAM_EXPAND = 'ObservedProperty($select=name,definition)'
+DETAIL_OBSERVATION_SELECT = 'phenomenonTime,result'
+DETAIL_OBSERVATION_EXPAND = 'Datastream($select=name)'
+
+# Chunk size used when streaming CSV response bodies
+STREAM_CHUNK_SIZE = 65536
+
+# Shared stand-in for a missing nested entity; read-only, never mutate
+EMPTY: Dict[str, Any] = {}
+
+# Fields unpacked from every Thing in search and fetch results
+THING_FIELDS = itemgetter('@iot.id', 'name', 'description')
+
+# Fields matched by free-text search terms
+NAME_OR_DESCRIPTION = ('name', 'description')
+
+# Most terms search_many will OR into a single upstream filter
+SEARCH_MANY_MAX_TERMS = 20
+
+# Geospatial filter templates, formatted with (lat1, lng1, lat2, lng2) and (lat, lng, radius_m)
+# plus the geometry property to test
+BBOX_FILTER = "geo.intersects({field}, geography'POLYGON(({1} {0}, {3} {0}, {3} {2}, {1} {2}, {1} {0}))')"
+POINT_FILTER = "geo.distance({field}, geography'POINT({1} {0})') le {2}"
+
+# Response cache lifetimes in seconds
+CACHE_TTL = 60
+CACHE_TTL_STATIC = 300
+CACHE_TTL_OBSERVATIONS = 5
+
+# Total size of cached response bodies, in bytes
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Directives that forbid reusing a response from a shared cache
+CACHE_CONTROL_UNCACHEABLE = ('no-store', 'no-cache', 'private')
+
+# Cached API responses keyed on (endpoint, sorted query params); each entry stores
+# (ttl, data, body size) and is bounded by total body size rather than entry count
+_cache = TLRUCache(maxsize=CACHE_MAX_BYTES, ttu=lambda key, value, now: now + value[0], getsizeof=itemgetter(2))
+_cache_lock = asyncio.Lock()
+
+# Bounded pool wait so bursts of tool calls queue rather than hang indefinitely
+API_TIMEOUT = httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=60.0)
+
+# Shared HTTP client so connections to the BGS API are kept alive between tool calls
+_client: Optional[httpx.AsyncClient] = None
+
+async def get_client() -> httpx.AsyncClient:
+    """Return the shared BGS API client, creating it on first use"""
+    global _client
+    if _client is None:
+        # Pool settings live on the transport, which also retries failed connection attempts
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=90)
+        )
+        _client = httpx.AsyncClient(
+            base_url=BGS_API_BASE,
+            transport=transport,
+            timeout=API_TIMEOUT,
+            headers={'User-Agent': 'BGS-FastMCP-Server/1.0.0'}
+        )
+    return _client
+
+async def close_client() -> None:
+    """Close the shared BGS API client"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Release pooled connections when the server shuts down"""
+    try:
+        yield
+    finally:
+        await close_client()
+
 mcp = FastMCP(
     name="BGS Sensor API",
-    instructions="Provides access to the British Geological Survey FROST Server API for sensor data discovery and observations."
+    instructions="Provides access to the British Geological Survey FROST Server API for sensor data discovery and observations.",
+    lifespan=lifespan
 )
 
-async def make_api_request(endpoint: str, params: Dict[str, Any] = None) -> Any:
-    """Make request to BGS FROST API"""
+def response_ttl(response: httpx.Response, default: int) -> int:
+    """Cache lifetime for a response, honouring Cache-Control max-age/no-store/no-cache/private"""
+    for directive in response.headers.get('Cache-Control', '').split(','):
+        name, _, value = directive.strip().partition('=')
+        name = name.lower()
+        if name in CACHE_CONTROL_UNCACHEABLE:
+            return 0
+        if name == 'max-age' and value.isdigit():
+            return int(value)
+    return default
+
+async def make_api_request(endpoint: str, params: Dict[str, Any] = None, ttl: Optional[int] = None) -> Any:
+    """Make request to BGS FROST API, serving repeated JSON/GeoJSON queries from cache"""
     if params is None:
         params = {}
-    
-    url = f"{BGS_API_BASE}/{endpoint}"
-    query_params = {}
+    if ttl is None:
+        # New observations arrive continuously, so only reuse them briefly
+        ttl = CACHE_TTL_OBSERVATIONS if endpoint.endswith('Observations') else CACHE_TTL
     
     # Add common OData parameters
-    if 'limit' in params:
-        query_params['$top'] = str(params['limit'])
-    if 'filter' in params:
-        query_params['$filter'] = params['filter']
-    if 'expand' in params:
-        query_params['$expand'] = params['expand']
-    if 'orderby' in params:
-        query_params['$orderby'] = params['orderby']
-    if 'select' in params:
-        query_params['$select'] = params['select']
-    if 'skip' in params:
-        query_params['$skip'] = str(params['skip'])
-    if 'count' in params:
-        query_params['$count'] = 'true'
+    query_params = {
+        option: (convert(params[key]) if convert else params[key])
+        for key, option, convert in ODATA_PARAMS if key in params
+    }
     
     # Format-specific parameters
     if params.get('format') == 'geojson':
@@ -45,96 +168,266 @@ async def make_api_request(endpoint: str, params: Dict[str, Any] = None) -> Any:
     elif params.get('format') == 'csv':
         query_params['$resultFormat'] = 'CSV'
     
-    if query_params:
-        url += '?' + urlencode(query_params)
+    cacheable = params.get('format') != 'csv'
+    cache_key = (endpoint, tuple(sorted(query_params.items())))
+    if cacheable:
+        async with _cache_lock:
+            cached = _cache.get(cache_key)
+        if cached is not None:
+            return cached[1]
     
-    headers = {
-        'Accept': 'text/csv' if params.get('format') == 'csv' else 'application/json',
-        'User-Agent': 'BGS-FastMCP-Server/1.0.0'
-    }
+    headers = HEADERS_CSV if params.get('format') == 'csv' else HEADERS_JSON
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers)
+    client = await get_client()
+    async with client.stream('GET', endpoint, params=query_params, headers=headers) as response:
         response.raise_for_status()
-        
         if params.get('format') == 'csv':
-            return response.text
+            # Collect decompressed chunks as they arrive and decode the text once
+            body = bytearray()
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                body.extend(chunk)
+            return body.decode(response.encoding or 'utf-8')
         
-        return response.json()
+        await response.aread()
+    
+    if params.get('format') == 'geojson':
+        # GeoJSON is handed back to the caller as served, so skip the parse/serialise round trip
+        data = response.text
+    else:
+        data = orjson.loads(response.content)
+    
+    ttl = response_ttl(response, ttl)
+    size = len(response.content)
+    # Bodies larger than the whole cache would be rejected by it, so don't try
+    if ttl > 0 and size <= CACHE_MAX_BYTES:
+        async with _cache_lock:
+            _cache[cache_key] = (ttl, data, size)
+    
+    return data
 
-def build_location_filter(location_filter: str) -> Optional[str]:
-    """Build OData location filter"""
+def escape_odata(value: str) -> str:
+    """Escape a value for use inside an OData string literal"""
+    return value.replace("'", "''")
+
+def gathered_values(result: Any, what: str, sensor_id: str) -> List[dict]:
+    """Entity list from an asyncio.gather result, or [] if that request failed"""
+    if isinstance(result, API_ERRORS):
+        logger.warning("Could not retrieve %s for sensor %s: %s", what, sensor_id, result)
+        return []
+    if isinstance(result, BaseException):
+        raise result
+    return result.get('value', [])
+
+def contains_ci(fields: tuple, needle: str) -> str:
+    """Build a case-insensitive OData substring match of needle against any of fields"""
+    literal = escape_odata(needle.lower())
+    clauses = [f"contains(tolower({field}), '{literal}')" for field in fields]
+    # Parenthesise alternatives so the clause can be safely joined with 'and'
+    return f"({' or '.join(clauses)})" if len(clauses) > 1 else clauses[0]
+
+@functools.lru_cache(maxsize=256)
+def build_location_filter(location_filter: str, field: str = 'location') -> Optional[str]:
+    """Build OData location filter against the given geometry property"""
     if not location_filter or ',' not in location_filter:
         return None
     
-    parts = location_filter.split(',')
+    # float() tolerates surrounding whitespace; anything past four parts fails to parse
+    try:
+        parts = [float(p) for p in location_filter.split(',', 3)]
+    except ValueError:
+        return None
+    
     if len(parts) == 4:
         # Bounding box: lat1,lng1,lat2,lng2
-        lat1, lng1, lat2, lng2 = [float(p.strip()) for p in parts]
-        return f"geo.intersects(location, geography'POLYGON(({lng1} {lat1}, {lng2} {lat1}, {lng2} {lat2}, {lng1} {lat2}, {lng1} {lat1}))')"
+        return BBOX_FILTER.format(*parts, field=field)
     elif len(parts) == 3:
         # Point with radius: lat,lng,radius_km
-        lat, lng, radius = [float(p.strip()) for p in parts]
-        radius_meters = radius * 1000
-        return f"geo.distance(location, geography'POINT({lng} {lat})') le {radius_meters}"
+        lat, lng, radius = parts
+        return POINT_FILTER.format(lat, lng, radius * 1000, field=field)
     
     return None
 
-@mcp.tool
-async def search(query: str) -> dict:
+def count_result(data: Dict[str, Any]) -> str:
+    """Serialise only the total count from a $top=0&$count=true response"""
+    return orjson.dumps({'total_count': data.get('@iot.count', 0)}, option=orjson.OPT_INDENT_2).decode()
+
+def build_search_result(sensor: Dict[str, Any]) -> dict:
+    """Build a search result (id, title, text snippet, URL) for a Thing"""
+    sensor_id, name, description = THING_FIELDS(sensor)
+    locations = sensor.get('Locations')
+    datastreams = sensor.get('Datastreams')
+    
+    # Create text snippet from description and location
+    location_info = ""
+    if locations:
+        loc = locations[0]
+        coords = loc['location']['coordinates']
+        location_info = f" Located at {loc['name']} ({coords[1]:.4f}, {coords[0]:.4f})"
+    
+    datastream_info = ""
+    if datastreams:
+        ds_count = len(datastreams)
+        datastream_info = f" Has {ds_count} datastream{'s' if ds_count != 1 else ''}"
+    
+    text_snippet = f"{description[:200]}{location_info}{datastream_info}"
+    
+    return {
+        "id": str(sensor_id),
+        "title": name,
+        "text": text_snippet,
+        "url": f"{BGS_API_BASE}/Things({sensor_id})"
+    }
+
+def build_datastream_result(ds: Dict[str, Any]) -> dict:
+    """Project a Datastream with its unit, observed property, Thing and Sensor"""
+    # Resolve each nested entity once per row
+    unit = ds.get('unitOfMeasurement') or EMPTY
+    obs_prop = ds.get('ObservedProperty') or EMPTY
+    thing = ds.get('Thing') or EMPTY
+    sensor = ds.get('Sensor') or EMPTY
+    return {
+        'id': ds['@iot.id'],
+        'name': ds['name'],
+        'description': ds['description'],
+        'unit': {
+            'name': unit.get('name'),
+            'symbol': unit.get('symbol'),
+            'definition': unit.get('definition')
+        },
+        'observed_property': {
+            'id': obs_prop.get('@iot.id'),
+            'name': obs_prop.get('name'),
+            'definition': obs_prop.get('definition'),
+            'description': obs_prop.get('description')
+        },
+        'sensor': {
+            'id': thing.get('@iot.id'),
+            'name': thing.get('name')
+        },
+        'hardware': {
+            'id': sensor.get('@iot.id'),
+            'name': sensor.get('name'),
+            'description': sensor.get('description')
+        }
+    }
+
+def build_observation_result(obs: Dict[str, Any]) -> dict:
+    """Project an Observation with a summary of its Datastream"""
+    # Resolve each nested entity once per row
+    ds = obs.get('Datastream') or EMPTY
+    obs_prop = ds.get('ObservedProperty') or EMPTY
+    thing = ds.get('Thing') or EMPTY
+    return {
+        'id': obs['@iot.id'],
+        'result': obs['result'],
+        'phenomenon_time': obs['phenomenonTime'],
+        'result_time': obs.get('resultTime'),
+        'quality': obs.get('resultQuality'),
+        'datastream': {
+            'id': ds.get('@iot.id'),
+            'name': ds.get('name'),
+            'unit': ds.get('unitOfMeasurement'),
+            'property': obs_prop.get('name'),
+            'sensor_name': thing.get('name')
+        }
+    }
+
+def build_location_result(loc: Dict[str, Any]) -> dict:
+    """Project a Location with its geometry and the Things at it"""
+    geometry = loc['location']
+    return {
+        'id': loc['@iot.id'],
+        'name': loc['name'],
+        'description': loc['description'],
+        'encoding_type': loc['encodingType'],
+        'geometry': {
+            'type': geometry['type'],
+            'coordinates': geometry['coordinates']
+        },
+        'sensors': [
+            {
+                'id': thing['@iot.id'],
+                'name': thing['name'],
+                'description': thing['description'],
+                'datastream_count': len(thing.get('Datastreams') or ())
+            } for thing in loc.get('Things') or ()
+        ]
+    }
+
+async def search(
+    query: Optional[str] = None,
+    limit: int = 20,
+    filter: Optional[str] = None,
+    location_filter: Optional[str] = None,
+    format: str = 'json'
+) -> Union[dict, str]:
     """Search for sensors/things with the specified query.
     
     Args:
         query: Search query string
+        limit: Maximum number of sensors to return
+        filter: Additional raw OData filter expression
+        location_filter: Bounding box "lat1,lng1,lat2,lng2" or point with radius "lat,lng,radius_km"
+        format: 'json', or 'geojson'/'csv' to return the upstream payload as text
         
     Returns:
         Dictionary with 'results' key containing list of matching sensors.
         Each result includes id, title, text snippet, and URL.
     """
-    if not query or not query.strip():
+    filters = []
+    
+    if query and query.strip():
+        filters.append(contains_ci(NAME_OR_DESCRIPTION, query))
+    
+    if location_filter:
+        loc_filter = build_location_filter(location_filter, 'Locations/location')
+        if loc_filter:
+            filters.append(loc_filter)
+    
+    if filter:
+        filters.append(f"({filter})")
+    
+    if not filters:
+        # An empty dict would not match the text payload promised for geojson/csv
+        if format != 'json':
+            raise ValueError(f"A query, filter or location_filter is required for format '{format}'")
         return {"results": []}
     
     params = {
-        'limit': 20,
+        'limit': limit,
         'expand': 'Locations,Datastreams',
         'count': True,
-        'filter': f"(contains(tolower(name), '{query.lower()}') or contains(tolower(description), '{query.lower()}'))"
+        'filter': ' and '.join(filters),
+        'format': format
     }
     
+    # Only fetch the fields projected below; GeoJSON/CSV output is returned as served
+    if format == 'json':
+        params['select'] = SEARCH_SELECT
+        params['expand'] = SEARCH_EXPAND
+    
     data = await make_api_request('Things', params)
     
-    results = []
-    for sensor in data.get('value', []):
-        # Create text snippet from description and location
-        location_info = ""
-        if sensor.get('Locations'):
-            loc = sensor['Locations'][0]
-            coords = loc['location']['coordinates']
-            location_info = f" Located at {loc['name']} ({coords[1]:.4f}, {coords[0]:.4f})"
-        
-        datastream_info = ""
-        if sensor.get('Datastreams'):
-            ds_count = len(sensor['Datastreams'])
-            datastream_info = f" Has {ds_count} datastream{'s' if ds_count != 1 else ''}"
-        
-        text_snippet = f"{sensor['description'][:200]}{location_info}{datastream_info}"
-        
-        result = {
-            "id": str(sensor['@iot.id']),
-            "title": sensor['name'],
-            "text": text_snippet,
-            "url": f"{BGS_API_BASE}/Things({sensor['@iot.id']})"
-        }
-        results.append(result)
+    if format in ('geojson', 'csv'):
+        return data
+    
+    results = [build_search_result(sensor) for sensor in data.get('value', [])]
     
     return {"results": results}
 
-@mcp.tool
-async def fetch(id: str) -> dict:
+async def fetch(
+    id: str,
+    include_datastreams: bool = True,
+    include_locations: bool = True,
+    include_observations: bool = False
+) -> dict:
     """Retrieve complete sensor details by ID.
     
     Args:
         id: Sensor ID (Thing ID) to fetch
+        include_datastreams: Include the sensor's datastreams and what they measure
+        include_locations: Include the sensor's locations
+        include_observations: Also include the latest observations across the sensor's datastreams
         
     Returns:
         Complete sensor details with id, title, full text content, URL, and metadata
@@ -142,30 +435,57 @@ async def fetch(id: str) -> dict:
     if not id:
         raise ValueError("Sensor ID is required")
     
-    # Fetch sensor details with full expansion
-    params = {
-        'expand': 'Locations,Datastreams($expand=ObservedProperty,Sensor)'
-    }
+    # The ID is interpolated into the resource path and the observations filter
+    id = str(id).strip()
+    if not id.isdigit():
+        raise ValueError(f"Sensor ID must be numeric: {id!r}")
+    
+    # The Thing, its locations, datastreams and latest observations are independent
+    # requests, so issue them concurrently; only the Thing itself is required
+    requests = [make_api_request(f'Things({id})')]
+    if include_locations:
+        requests.append(make_api_request(f'Things({id})/Locations', {'select': DETAIL_LOCATION_SELECT}))
+    if include_datastreams:
+        requests.append(make_api_request(f'Things({id})/Datastreams', {'select': DETAIL_DATASTREAM_SELECT, 'expand': DETAIL_DATASTREAM_EXPAND}))
+    if include_observations:
+        obs_params = {
+            'limit': 10,
+            'orderby': 'phenomenonTime desc',
+            'select': DETAIL_OBSERVATION_SELECT,
+            'expand': DETAIL_OBSERVATION_EXPAND,
+            'filter': f'Datastream/Thing/id eq {id}'
+        }
+        requests.append(make_api_request('Observations', obs_params))
+    
+    data, *related = await asyncio.gather(*requests, return_exceptions=True)
+    if isinstance(data, BaseException):
+        raise data
     
-    data = await make_api_request(f'Things({id})', params)
+    related = iter(related)
+    locations = gathered_values(next(related), 'locations', id) if include_locations else []
+    datastreams = gathered_values(next(related), 'datastreams', id) if include_datastreams else []
+    observations = gathered_values(next(related), 'observations', id) if include_observations else []
+    
+    sensor_id, name, description = THING_FIELDS(data)
+    properties = data.get('properties')
     
     # Build comprehensive text content
     text_parts = []
-    text_parts.append(f"Name: {data['name']}")
-    text_parts.append(f"Description: {data['description']}")
+    text_parts.append(f"Name: {name}")
+    text_parts.append(f"Description: {description}")
     
     # Add location information
-    if data.get('Locations'):
-        for loc in data['Locations']:
+    if locations:
+        for loc in locations:
             coords = loc['location']['coordinates']
             text_parts.append(f"\nLocation: {loc['name']}")
             text_parts.append(f"Coordinates: {coords[1]:.6f}, {coords[0]:.6f}")
             text_parts.append(f"Location Description: {loc['description']}")
     
     # Add datastream information
-    if data.get('Datastreams'):
-        text_parts.append(f"\nDatastreams ({len(data['Datastreams'])}):")  
-        for ds in data['Datastreams']:
+    if datastreams:
+        text_parts.append(f"\nDatastreams ({len(datastreams)}):")
+        for ds in datastreams:
             text_parts.append(f"- {ds['name']}: {ds['description']}")
             unit = ds.get('unitOfMeasurement', {})
             if unit:
@@ -177,116 +497,129 @@ async def fetch(id: str) -> dict:
                 text_parts.append(f"  Observed Property: {obs_prop.get('name', 'N/A')}")
                 text_parts.append(f"  Definition: {obs_prop.get('definition', 'N/A')}")
     
+    # Add latest observations
+    if observations:
+        text_parts.append(f"\nLatest Observations ({len(observations)}):")
+        for obs in observations:
+            ds_name = obs.get('Datastream', {}).get('name', 'N/A')
+            text_parts.append(f"- {obs['phenomenonTime']} {ds_name}: {obs['result']}")
+    
     # Add properties if available
-    if data.get('properties'):
-        text_parts.append(f"\nProperties: {json.dumps(data['properties'], indent=2)}")
+    if properties:
+        text_parts.append(f"\nProperties: {orjson.dumps(properties, option=orjson.OPT_INDENT_2).decode()}")
     
     full_text = "\n".join(text_parts)
     
     result = {
-        "id": str(data['@iot.id']),
-        "title": data['name'],
+        "id": str(sensor_id),
+        "title": name,
         "text": full_text,
-        "url": f"{BGS_API_BASE}/Things({data['@iot.id']})",
+        "url": f"{BGS_API_BASE}/Things({sensor_id})",
         "metadata": {
-            "location_count": len(data.get('Locations', [])),
-            "datastream_count": len(data.get('Datastreams', [])),
-            "properties": data.get('properties')
+            "location_count": len(locations),
+            "datastream_count": len(datastreams),
+            "observation_count": len(observations),
+            "properties": properties
         }
     }
     
     return result
 
 # Additional tools for comprehensive API access
-@mcp.tool
-async def search_sensors(
-    query: Optional[str] = None,
-    limit: int = 20,
-    filter: Optional[str] = None,
-    location_filter: Optional[str] = None,
-    format: str = 'json'
-) -> str:
-    """Alias for search function - search and discover sensors/things with advanced filtering"""
-    return await search(query, limit, filter, location_filter, format)
-
-@mcp.tool
-async def get_sensor_details(
-    sensor_id: str,
-    include_datastreams: bool = True,
-    include_locations: bool = True,
-    include_observations: bool = False
-) -> str:
-    """Alias for fetch function - get comprehensive details about a specific sensor"""
-    return await fetch(sensor_id, include_datastreams, include_locations, include_observations)
+async def search_many(queries: List[str], limit: int = 20) -> dict:
+    """Search for sensors/things matching any of several queries in a single request.
+    
+    Args:
+        queries: Search query strings
+        limit: Maximum number of sensors to retrieve across all queries
+        
+    Returns:
+        Dictionary with 'results' key mapping each query to its list of matching sensors.
+        Each result includes id, title, text snippet, and URL. The limit is shared, so a
+        broad term can use it up and leave later terms with empty lists even when matching
+        sensors exist.
+    """
+    # Matching is case-insensitive, so dedupe on the normalised term and keep the first spelling
+    terms: Dict[str, str] = {}
+    for q in queries:
+        if q and q.strip():
+            terms.setdefault(q.strip().lower(), q)
+    if not terms:
+        return {"results": {}}
+    if len(terms) > SEARCH_MANY_MAX_TERMS:
+        raise ValueError(f"At most {SEARCH_MANY_MAX_TERMS} queries can be searched at once")
+    
+    # One upstream round trip for all terms instead of one per term
+    params = {
+        'limit': limit,
+        'select': SEARCH_SELECT,
+        'expand': SEARCH_EXPAND,
+        'filter': ' or '.join(contains_ci(NAME_OR_DESCRIPTION, needle) for needle in terms)
+    }
+    
+    data = await make_api_request('Things', params)
+    
+    # Partition the combined matches back out per query
+    results = {q: [] for q in terms.values()}
+    for sensor in data.get('value', []):
+        haystack = f"{sensor['name']}\n{sensor['description']}".lower()
+        result = build_search_result(sensor)
+        for needle, query in terms.items():
+            if needle in haystack:
+                results[query].append(result)
+    
+    return {"results": results}
 
-@mcp.tool
 async def get_datastreams(
     sensor_id: Optional[str] = None,
     property_name: Optional[str] = None,
     unit_name: Optional[str] = None,
     limit: int = 20,
-    filter: Optional[str] = None
+    filter: Optional[str] = None,
+    count_only: bool = False
 ) -> str:
     """Get datastreams with filtering and search capabilities"""
     endpoint = f'Things({sensor_id})/Datastreams' if sensor_id else 'Datastreams'
     
     params = {
-        'limit': limit,
-        'expand': 'Thing,ObservedProperty,Sensor',
+        'limit': 0 if count_only else limit,
         'count': True
     }
     
+    # Counting needs no rows, so skip the projection and expansion entirely
+    if not count_only:
+        params['select'] = DATASTREAM_SELECT
+        params['expand'] = DATASTREAM_EXPAND
+    
     filters = []
     
     if property_name:
-        filters.append(f"contains(tolower(ObservedProperty/name), '{property_name.lower()}')")
+        filters.append(contains_ci(('ObservedProperty/name',), property_name))
     
     if unit_name:
-        filters.append(f"contains(tolower(unitOfMeasurement/name), '{unit_name.lower()}')")
+        filters.append(contains_ci(('unitOfMeasurement/name',), unit_name))
     
     if filter:
-        filters.append(filter)
+        filters.append(f"({filter})")
     
     if filters:
         params['filter'] = ' and '.join(filters)
     
     data = await make_api_request(endpoint, params)
     
+    if count_only:
+        return count_result(data)
+    
+    datastreams = list(map(build_datastream_result, data.get('value', [])))
+    
     result = {
-        'message': f"Found {len(data.get('value', []))} datastreams",
-        'total_count': data.get('@iot.count', len(data.get('value', []))),
-        'datastreams': [
-            {
-                'id': ds['@iot.id'],
-                'name': ds['name'],
-                'description': ds['description'],
-                'unit': {
-                    'name': ds.get('unitOfMeasurement', {}).get('name'),
-                    'symbol': ds.get('unitOfMeasurement', {}).get('symbol'),
-                    'definition': ds.get('unitOfMeasurement', {}).get('definition')
-                },
-                'observed_property': {
-                    'id': ds.get('ObservedProperty', {}).get('@iot.id'),
-                    'name': ds.get('ObservedProperty', {}).get('name'),
-                    'definition': ds.get('ObservedProperty', {}).get('definition'),
-                    'description': ds.get('ObservedProperty', {}).get('description')
-                },
-                'sensor': {
-                    'id': ds.get('Thing', {}).get('@iot.id'),
-                    'name': ds.get('Thing', {}).get('name')
-                },
-                'hardware': {
-                    'id': ds.get('Sensor', {}).get('@iot.id'),
-                    'name': ds.get('Sensor', {}).get('name'),
-                    'description': ds.get('Sensor', {}).get('description')
-                }
-            } for ds in data.get('value', [])
-        ]
+        'message': f"Found {len(datastreams)} datastreams",
+        'total_count': data.get('@iot.count', len(datastreams)),
+        'datastreams': datastreams
     }
     
-    return json.dumps(result, indent=2)
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
 
-@mcp.tool
 async def get_observations(
     datastream_id: Optional[str] = None,
     sensor_id: Optional[str] = None,
@@ -312,6 +645,11 @@ async def get_observations(
         'format': format
     }
     
+    # Only fetch the fields projected below; GeoJSON/CSV output is returned as served
+    if format == 'json':
+        params['select'] = OBSERVATION_SELECT
+        params['expand'] = OBSERVATION_EXPAND
+    
     filters = []
     if start_time and end_time:
         filters.append(f'phenomenonTime ge {start_time} and phenomenonTime le {end_time}')
@@ -325,25 +663,10 @@ async def get_observations(
     
     data = await make_api_request(endpoint, params)
     
-    if format == 'csv':
+    if format in ('geojson', 'csv'):
         return data
     
-    observations = [
-        {
-            'id': obs['@iot.id'],
-            'result': obs['result'],
-            'phenomenon_time': obs['phenomenonTime'],
-            'result_time': obs.get('resultTime'),
-            'quality': obs.get('resultQuality'),
-            'datastream': {
-                'id': obs.get('Datastream', {}).get('@iot.id'),
-                'name': obs.get('Datastream', {}).get('name'),
-                'unit': obs.get('Datastream', {}).get('unitOfMeasurement'),
-                'property': obs.get('Datastream', {}).get('ObservedProperty', {}).get('name'),
-                'sensor_name': obs.get('Datastream', {}).get('Thing', {}).get('name')
-            }
-        } for obs in data.get('value', [])
-    ]
+    observations = list(map(build_observation_result, data.get('value', [])))
     
     result = {
         'message': f"Found {len(observations)} observations",
@@ -356,9 +679,8 @@ async def get_observations(
         'observations': observations
     }
     
-    return json.dumps(result, indent=2)
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
 
-@mcp.tool
 async def get_locations(
     bbox: Optional[str] = None,
     point: Optional[str] = None,
@@ -373,6 +695,11 @@ async def get_locations(
         'format': format
     }
     
+    # Only fetch the fields projected below; GeoJSON/CSV output is returned as served
+    if format == 'json':
+        params['select'] = LOCATION_SELECT
+        params['expand'] = LOCATION_EXPAND
+    
     filters = []
     
     if bbox:
@@ -390,51 +717,37 @@ async def get_locations(
     
     data = await make_api_request('Locations', params)
     
-    if format == 'geojson':
-        return json.dumps(data)
+    if format in ('geojson', 'csv'):
+        return data
+    
+    locations = list(map(build_location_result, data.get('value', [])))
     
     result = {
-        'message': f"Found {len(data.get('value', []))} locations",
-        'total_count': data.get('@iot.count', len(data.get('value', []))),
-        'locations': [
-            {
-                'id': loc['@iot.id'],
-                'name': loc['name'],
-                'description': loc['description'],
-                'encoding_type': loc['encodingType'],
-                'geometry': {
-                    'type': loc['location']['type'],
-                    'coordinates': loc['location']['coordinates']
-                },
-                'sensors': [
-                    {
-                        'id': thing['@iot.id'],
-                        'name': thing['name'],
-                        'description': thing['description'],
-                        'datastream_count': len(thing.get('Datastreams', []))
-                    } for thing in loc.get('Things', [])
-                ]
-            } for loc in data.get('value', [])
-        ]
+        'message': f"Found {len(locations)} locations",
+        'total_count': data.get('@iot.count', len(locations)),
+        'locations': locations
     }
     
-    return json.dumps(result, indent=2)
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
 
-@mcp.tool
 async def get_observed_properties(
     search: Optional[str] = None,
-    limit: int = 50
+    limit: int = 50,
+    count_only: bool = False
 ) -> str:
     """Get all available measurement types/properties"""
     params = {
-        'limit': limit,
+        'limit': 0 if count_only else limit,
         'count': True
     }
     
     if search:
-        params['filter'] = f"contains(tolower(name), '{search.lower()}') or contains(tolower(description), '{search.lower()}')"
+        params['filter'] = contains_ci(NAME_OR_DESCRIPTION, search)
+    
+    data = await make_api_request('ObservedProperties', params, ttl=CACHE_TTL_STATIC)
     
-    data = await make_api_request('ObservedProperties', params)
+    if count_only:
+        return count_result(data)
     
     result = {
         'message': f"Found {len(data.get('value', []))} observed properties",
@@ -449,33 +762,36 @@ async def get_observed_properties(
         ]
     }
     
-    return json.dumps(result, indent=2)
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
 
-@mcp.tool
 async def get_sensors_hardware(
     manufacturer: Optional[str] = None,
     model: Optional[str] = None,
-    limit: int = 20
+    limit: int = 20,
+    count_only: bool = False
 ) -> str:
     """Get physical sensor hardware information"""
     params = {
-        'limit': limit,
+        'limit': 0 if count_only else limit,
         'count': True
     }
     
     filters = []
     
     if manufacturer:
-        filters.append(f"contains(tolower(name), '{manufacturer.lower()}') or contains(tolower(description), '{manufacturer.lower()}')")
+        filters.append(contains_ci(NAME_OR_DESCRIPTION, manufacturer))
     
     if model:
-        filters.append(f"contains(tolower(name), '{model.lower()}') or contains(tolower(description), '{model.lower()}')")
+        filters.append(contains_ci(NAME_OR_DESCRIPTION, model))
     
     if filters:
         params['filter'] = ' and '.join(filters)
     
     data = await make_api_request('Sensors', params)
     
+    if count_only:
+        return count_result(data)
+    
     result = {
         'message': f"Found {len(data.get('value', []))} sensors",
         'total_count': data.get('@iot.count', len(data.get('value', []))),
@@ -490,33 +806,36 @@ async def get_sensors_hardware(
         ]
     }
     
-    return json.dumps(result, indent=2)
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
 
-@mcp.tool
 async def get_features_of_interest(
     search: Optional[str] = None,
     geometry_type: Optional[str] = None,
-    limit: int = 20
+    limit: int = 20,
+    count_only: bool = False
 ) -> str:
     """Get features of interest (what is being observed)"""
     params = {
-        'limit': limit,
+        'limit': 0 if count_only else limit,
         'count': True
     }
     
     filters = []
     
     if search:
-        filters.append(f"contains(tolower(name), '{search.lower()}') or contains(tolower(description), '{search.lower()}')")
+        filters.append(contains_ci(NAME_OR_DESCRIPTION, search))
     
     if geometry_type:
-        filters.append(f"feature/type eq '{geometry_type}'")
+        filters.append(f"feature/type eq '{escape_odata(geometry_type)}'")
     
     if filters:
         params['filter'] = ' and '.join(filters)
     
     data = await make_api_request('FeaturesOfInterest', params)
     
+    if count_only:
+        return count_result(data)
+    
     result = {
         'message': f"Found {len(data.get('value', []))} features of interest",
         'total_count': data.get('@iot.count', len(data.get('value', []))),
@@ -534,13 +853,12 @@ async def get_features_of_interest(
         ]
     }
     
-    return json.dumps(result, indent=2)
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
 
-@mcp.tool
 async def get_api_info() -> str:
     """Get BGS FROST API capabilities and metadata"""
     try:
-        data = await make_api_request('')
+        data = await make_api_request('', ttl=CACHE_TTL_STATIC)
         
         result = {
             'api_info': {
@@ -562,18 +880,46 @@ async def get_api_info() -> str:
             }
         }
         
-        return json.dumps(result, indent=2)
-    except:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+    except API_ERRORS as e:
+        logger.warning("Could not retrieve API information: %s", e)
         result = {
             'error': 'Could not retrieve API information',
             'base_url': BGS_API_BASE,
             'message': 'BGS FROST Server - British Geological Survey Sensor Things API'
         }
         
-        return json.dumps(result, indent=2)
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+
+# Tool registry: (function, tool name, description); a None description uses the docstring.
+# Aliases point at the same coroutines rather than wrapping them, so they share one
+# signature and implementation.
+TOOLS = [
+    (search, "search", None),
+    (fetch, "fetch", None),
+    (search, "search_sensors", "Alias for search function - search and discover sensors/things"),
+    (fetch, "get_sensor_details", "Alias for fetch function - get comprehensive details about a specific sensor"),
+    (search_many, "search_many", None),
+    (get_datastreams, "get_datastreams", None),
+    (get_observations, "get_observations", None),
+    (get_locations, "get_locations", None),
+    (get_observed_properties, "get_observed_properties", None),
+    (get_sensors_hardware, "get_sensors_hardware", None),
+    (get_features_of_interest, "get_features_of_interest", None),
+    (get_api_info, "get_api_info", None)
+]
+
+for fn, name, description in TOOLS:
+    mcp.tool(fn, name=name, description=description)
 
 if __name__ == "__main__":
-    import asyncio
     port = int(os.environ.get("PORT", 8000))
+    # Per-request debug logging is costly under load; opt in with LOG_LEVEL=debug
+    log_level = os.environ.get("LOG_LEVEL", "info")
     # Use FastMCP's built-in SSE transport for ChatGPT compatibility
-    mcp.run(transport="sse", host="0.0.0.0", port=port)
\ No newline at end of file
+    server_coro = mcp.run_async(transport="sse", host="0.0.0.0", port=port, log_level=log_level)
+    # Prefer the libuv-based event loop when it is installed
+    if uvloop is not None:
+        uvloop.run(server_coro)
+    else:
+        asyncio.run(server_coro)
\ No newline at end of file